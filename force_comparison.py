@@ -24,9 +24,10 @@
 #  - "Lower than any G&K unit" if force < min standard unit
 
 from bisect import bisect_right
-from typing import List, Tuple
+from itertools import groupby
+from typing import Tuple
 
-_UNITS: List[Tuple[str, float]] = [
+_UNITS: Tuple[Tuple[str, float], ...] = (
     ("Scout", 13.0),
     ("Archer", 19.0),
     ("Slinger", 19.0),
@@ -131,11 +132,19 @@ _UNITS: List[Tuple[str, float]] = [
     ("Giant Death Robot", 2977.0),
     ("Atomic Bomb", 4714.0),
     ("Nuclear Missile", 7906.0),
-]
+)
 
-# Split into parallel lists for fast bisect operations
-_FORCES: List[float] = [f for (_n, f) in _UNITS]
-_NAMES: List[str] = [n for (n, _f) in _UNITS]
+# Units sharing a force are collapsed into one search entry, since bisect can only ever land on the
+# edge of such a group. For each distinct force, keep the last unit (reported as the lower bound) and the
+# first unit (reported as the upper bound), so results match a search over the full list.
+_GROUPS: Tuple[Tuple[float, Tuple[str, ...]], ...] = tuple(
+    (f, tuple(n for (n, _f) in group)) for (f, group) in groupby(_UNITS, key=lambda unit: unit[1])
+)
+
+# Split into parallel tuples for fast bisect operations
+_FORCES: Tuple[float, ...] = tuple(f for (f, _names) in _GROUPS)
+_LOWER_NAMES: Tuple[str, ...] = tuple(names[-1] for (_f, names) in _GROUPS)
+_HIGHER_NAMES: Tuple[str, ...] = tuple(names[0] for (_f, names) in _GROUPS)
 
 
 def find_force_bounds(force: float) -> str:
@@ -166,7 +175,7 @@ def find_force_bounds(force: float) -> str:
         lower_idx = max(0, j - 1)
         higher_idx = j
 
-    return f"Between {_NAMES[lower_idx]} and {_NAMES[higher_idx]}"
+    return f"Between {_LOWER_NAMES[lower_idx]} and {_HIGHER_NAMES[higher_idx]}"
 
 # Example usages (commented out):
 # print(find_force_bounds(15.0))    # Between Scout and Archer
@@ -14,19 +14,19 @@
 #    You should have received a copy of the GNU Affero General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from user_input import get_input_as_bool
+from user_input import get_input_as_bool, get_input_as_int, get_input_as_float
 from math_stuff import percent_to_decimal
 
 is_ranged = get_input_as_bool("Is the unit ranged? ")
 
 if is_ranged:
-	strength = int(input("Ranged strength: "))
+	strength = get_input_as_int("Ranged strength: ")
 	force = strength ** 1.45
 else:
-	strength = int(input("Strength: "))
+	strength = get_input_as_int("Strength: ")
 	force = strength ** 1.5
 
-movement = int(input("Movement: "))
+movement = get_input_as_int("Movement: ")
 force *= (movement ** 0.3)
 
 is_nuke = get_input_as_bool("Is it a nuke? ")
@@ -45,25 +45,21 @@ self_destructs = get_input_as_bool("Does it self-destruct when attacking? ")
 if self_destructs:
 	force *= 0.5
 
-city_attack_bonus = float(input("Percent bonus when attacking cities (0 if none): "))
+city_attack_bonus = get_input_as_float("Percent bonus when attacking cities (0 if none): ")
 
-if city_attack_bonus != 0: #If city_attack_bonus were 0, adding half of it would make force zero
-	force *= percent_to_decimal(1.5 * city_attack_bonus)
+force *= percent_to_decimal(1.5 * city_attack_bonus)
 
-attack_vs_bonus = float(input("Bonus when attacking something that's not a city (0 if none): "))
+attack_vs_bonus = get_input_as_float("Bonus when attacking something that's not a city (0 if none): ")
 
-if attack_vs_bonus != 0: #If attack_vs_bonus were 0, adding a quarter of it would make force zero
-	force *= percent_to_decimal(1.25 * attack_vs_bonus)
+force *= percent_to_decimal(1.25 * attack_vs_bonus)
 
-attack_bonus = float(input("Bonus when attacking (0 if none): "))
+attack_bonus = get_input_as_float("Bonus when attacking (0 if none): ")
 
-if attack_bonus != 0: #If attack_bonus were 0, adding half of it would make force zero
-	force *= percent_to_decimal(1.5 * attack_bonus)
+force *= percent_to_decimal(1.5 * attack_bonus)
 
-defend_bonus = float(input("Bonus when defending (0 if none): "))
+defend_bonus = get_input_as_float("Bonus when defending (0 if none): ")
 
-if defend_bonus != 0: #If defend_bonus were 0, adding half of it would make force zero
-	force *= percent_to_decimal(1.5 * defend_bonus)
+force *= percent_to_decimal(1.5 * defend_bonus)
 
 paradrop_able = get_input_as_bool("Can it paradrop? ")
 
@@ -75,16 +71,14 @@ must_set_up = get_input_as_bool("Does it need to Set Up to attack? ")
 if must_set_up:
 	force *= 0.8
 
-terrain_bonus = float(input("Bonus on a particular terrain (0 if none): "))
+terrain_bonus = get_input_as_float("Bonus on a particular terrain (0 if none): ")
 
-if terrain_bonus != 0: #If terrain_bonus were 0, adding half of it would make force zero
-	force *= percent_to_decimal(1.5 * terrain_bonus)
+force *= percent_to_decimal(1.5 * terrain_bonus)
 
-extra_attacks = int(input("Number of extra attacks per turn (0 if none): "))
+extra_attacks = get_input_as_int("Number of extra attacks per turn (0 if none): ")
 
-if extra_attacks != 0: #If extra_attacks were 0, adding two-tenths of it would make force zero
-	force *= (1 + (0.2 * extra_attacks))
+force *= (1 + (0.2 * extra_attacks))
 
 print("\n*************************\n")
-print("Base Unit Force: " + str(force))
+print(f"Base Unit Force: {force}")
 print("\n*************************\n")
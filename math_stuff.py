@@ -15,5 +15,4 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 def percent_to_decimal(percent):
-	decimal = float(percent / 100)
-	return 1 + decimal
+	return 1 + percent / 100
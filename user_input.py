@@ -14,19 +14,40 @@
 #    You should have received a copy of the GNU Affero General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import re
+
+_INT_PATTERN = re.compile(r"[+-]?\d+")
+_FLOAT_PATTERN = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
 def get_input_as_bool(prompt, error_on_bad_input=False):
 	positive = {"yes", "y", "true"}
 	negative = {"no", "n", "false"}
 	
-	answer = input(prompt)
-	answer = answer.lower()
-	
-	if answer in positive:
-		return True
-	elif answer in negative:
-		return False
-	else:
-		if error_on_bad_input:
+	while True:
+		answer = input(prompt)
+		answer = answer.lower()
+		
+		if answer in positive:
+			return True
+		elif answer in negative:
+			return False
+		elif error_on_bad_input:
 			raise ValueError("Input must be yes, y, true, no, n, or false")
-		else:
-			return get_input_as_bool(prompt, error_on_bad_input=error_on_bad_input)
+
+def get_input_as_int(prompt, error_on_bad_input=False):
+	while True:
+		answer = input(prompt).strip()
+		
+		if _INT_PATTERN.fullmatch(answer):
+			return int(answer)
+		elif error_on_bad_input:
+			raise ValueError("Input must be a whole number")
+
+def get_input_as_float(prompt, error_on_bad_input=False):
+	while True:
+		answer = input(prompt).strip()
+		
+		if _FLOAT_PATTERN.fullmatch(answer):
+			return float(answer)
+		elif error_on_bad_input:
+			raise ValueError("Input must be a number")